@@ -6,6 +6,7 @@ Provides customized admin views for Profile, Mood, Song, and UserMood models.
 """
 
 from django.contrib import admin
+from django.db.models import Count
 from .models import Profile, Mood, Song, UserMood
 
 
@@ -29,11 +30,29 @@ class MoodAdmin(admin.ModelAdmin):
     
     Manages mood categories used for music classification.
     Provides search functionality and alphabetical ordering.
+    Song counts are annotated onto the changelist queryset in one query.
     """
-    list_display = ('name', 'description')
+    list_display = ('name', 'description', 'song_count')
     search_fields = ('name',)
     ordering = ('name',)
 
+    def get_queryset(self, request):
+        """
+        Annotate each mood with its number of songs.
+        
+        Args:
+            request (HttpRequest): The current admin request
+        
+        Returns:
+            QuerySet: Moods annotated with ``song_count``
+        """
+        return super().get_queryset(request).annotate(song_count=Count('songs'))
+
+    @admin.display(description='Songs', ordering='song_count')
+    def song_count(self, obj):
+        """Return the annotated number of songs for the mood."""
+        return obj.song_count
+
 
 @admin.register(Song)
 class SongAdmin(admin.ModelAdmin):
@@ -42,8 +61,10 @@ class SongAdmin(admin.ModelAdmin):
     
     Manages the music library with mood-based categorization.
     Includes filtering by mood and search by title/artist.
+    The mood is joined into the changelist query for display.
     """
     list_display = ('title', 'artist', 'mood', 'spotify_url')
+    list_select_related = ('mood',)
     list_filter = ('mood',)
     search_fields = ('title', 'artist')
     ordering = ('title',)
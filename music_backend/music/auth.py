@@ -0,0 +1,46 @@
+"""
+Django REST Framework Authentication for Moodify API
+
+Provides a token authentication class that caches token lookups so
+authenticated requests don't query the token table every time. It is only
+installed when a shared cache (REDIS_URL) is configured; with per-process
+caches a token deleted in one worker would stay valid in the others.
+"""
+
+from django.core.cache import cache
+from rest_framework.authentication import TokenAuthentication
+
+# Seconds a resolved token stays cached; bounds how long a deactivated
+# user can keep authenticating with a still-cached token
+TOKEN_CACHE_TIMEOUT = 60
+
+
+def token_cache_key(key: str) -> str:
+    """Return the cache key under which a token's (user, token) pair is stored"""
+    return f"music:auth-token:{key}"
+
+
+def invalidate_cached_token(key: str) -> None:
+    """Drop a token from the authentication cache, e.g. after it is deleted"""
+    cache.delete(token_cache_key(key))
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication backed by Django's cache framework.
+
+    Successful lookups are cached for TOKEN_CACHE_TIMEOUT seconds, so repeat
+    requests with the same token skip the authtoken_token query. Deleted
+    tokens are evicted by a post_delete signal handler, which reaches every
+    worker only because the cache backend is shared (see SHARED_CACHE).
+    """
+
+    def authenticate_credentials(self, key):
+        cache_key = token_cache_key(key)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        user, token = super().authenticate_credentials(key)
+        cache.set(cache_key, (user, token), TOKEN_CACHE_TIMEOUT)
+        return user, token
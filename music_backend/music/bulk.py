@@ -0,0 +1,70 @@
+"""
+Bulk Database Helpers for Moodify Music Application
+
+This module contains helpers shared by the data population commands for
+inserting many rows with as few database round-trips as possible.
+"""
+
+from itertools import islice
+from typing import Any, Iterable, List, Mapping, Optional, Set, Tuple, Type
+
+from django.conf import settings
+from django.db import models
+
+from .models import Song
+
+
+def existing_song_keys(songs: Iterable[Mapping[str, object]]) -> Set[Tuple[str, str]]:
+    """
+    Return the (title, artist) pairs from ``songs`` that are already stored.
+
+    Uses one indexed IN query instead of a lookup per song. The query may
+    match pairs that mix titles and artists from different entries, which
+    is harmless because callers test membership with the exact pair.
+
+    Args:
+        songs (Iterable[Mapping]): Song data with 'title' and 'artist' keys
+
+    Returns:
+        Set[Tuple[str, str]]: Existing (title, artist) pairs
+    """
+    songs = list(songs)
+    return set(
+        Song.objects.filter(
+            title__in={song_data['title'] for song_data in songs},
+            artist__in={song_data['artist'] for song_data in songs},
+        ).values_list('title', 'artist')
+    )
+
+
+def dict_bulk_create(
+    model: Type[models.Model],
+    rows: Iterable[Mapping[str, Any]],
+    batch_size: Optional[int] = None,
+    **kwargs: Any,
+) -> List[models.Model]:
+    """
+    Insert plain field dicts with ``bulk_create``, one batch at a time.
+
+    Stand-in for passing dicts straight to ``bulk_create``, which Django
+    does not support yet. Model instances are built lazily for each batch
+    right before its INSERT, so at most ``batch_size`` unsaved instances
+    exist at once.
+
+    Args:
+        model (Type[Model]): Model class to insert into
+        rows (Iterable[Mapping]): Field name -> value dicts, one per row
+        batch_size (int, optional): Rows per INSERT; defaults to BULK_BATCH_SIZE
+        **kwargs: Extra options forwarded to ``bulk_create``
+
+    Returns:
+        List[Model]: The instances handed to ``bulk_create``
+    """
+    batch_size = batch_size or settings.BULK_BATCH_SIZE
+    rows = iter(rows)
+    created: List[models.Model] = []
+    while True:
+        batch = [model(**row) for row in islice(rows, batch_size)]
+        if not batch:
+            return created
+        created.extend(model.objects.bulk_create(batch, batch_size=batch_size, **kwargs))
@@ -0,0 +1,32 @@
+"""
+Cache Keys and Invalidation for Moodify Reference Data
+
+Mood labels change rarely, so the serialized mood list is kept in Django's
+cache and evicted whenever moods are written. Eviction only reaches other
+processes when the cache backend is shared (settings.SHARED_CACHE); with
+per-process caches the entry is left to expire instead, so the timeout is
+kept short.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+
+MOODS_CACHE_KEY = "music:moods"
+# Upper bound on staleness: long when evictions reach every process, short when
+# another worker or a seeding script can't evict this process's entry
+MOODS_CACHE_TIMEOUT = 60 * 60 if settings.SHARED_CACHE else 60
+
+
+def invalidate_moods_cache() -> None:
+    """
+    Evict the cached mood list.
+
+    Called from the Mood post_save/post_delete signal handlers, and explicitly
+    by the population scripts after their bulk writes, since bulk_create
+    doesn't send model signals. Register it with transaction.on_commit so it
+    runs after the write commits; evicting earlier lets a concurrent request
+    re-cache the old rows. Only the current process's entry is cleared unless
+    the cache backend is shared, so a script run without one doesn't reach
+    the server, whose entry instead expires after MOODS_CACHE_TIMEOUT.
+    """
+    cache.delete(MOODS_CACHE_KEY)
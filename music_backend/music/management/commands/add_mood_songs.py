@@ -0,0 +1,212 @@
+"""
+Django Management Command for Mood-Improvement Songs
+
+This module defines a custom Django management command that adds curated songs
+designed to improve user mood based on psychological principles.
+Can be run using 'python manage.py add_mood_songs'.
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count
+from music.bulk import dict_bulk_create, existing_song_keys
+from music.models import Mood, Song
+
+
+# Curated song collection for mood improvement therapy, keyed to mood names
+# so it can be built once at import time
+MOOD_IMPROVEMENT_SONGS: tuple[dict[str, str], ...] = (
+    # Happy songs - recommended for users feeling sad or down
+    {
+        'title': 'Happy',
+        'artist': 'Pharrell Williams',
+        'album': 'G I R L',
+        'mood': 'Happy',
+        'spotify_url': 'https://open.spotify.com/track/60nZcImufyMA1MKQY3dcCH',
+    },
+    {
+        'title': 'Can\'t Stop the Feeling!',
+        'artist': 'Justin Timberlake',
+        'album': 'Trolls',
+        'mood': 'Happy',
+        'spotify_url': 'https://open.spotify.com/track/20I6sIOMTCkB6w7ryavxtO',
+    },
+    {
+        'title': 'Walking on Sunshine',
+        'artist': 'Katrina and the Waves',
+        'album': 'Walking on Sunshine',
+        'mood': 'Happy',
+        'spotify_url': 'https://open.spotify.com/track/2q3rBKV48hJJrQc6JRPKjy',
+    },
+    {
+        'title': 'Good as Hell',
+        'artist': 'Lizzo',
+        'album': 'Cuz I Love You',
+        'mood': 'Happy',
+        'spotify_url': 'https://open.spotify.com/track/6KJcoZtCLwNIbEGhSDKV8a',
+    },
+
+    # Calm songs - recommended for users feeling angry or anxious
+    {
+        'title': 'Breathe Me',
+        'artist': 'Sia',
+        'album': 'Colour the Small One',
+        'mood': 'Calm',
+        'spotify_url': 'https://open.spotify.com/track/4VdBDdmTGdhgW3FKrfj3QZ',
+    },
+    {
+        'title': 'Mad World',
+        'artist': 'Gary Jules',
+        'album': 'Donnie Darko Soundtrack',
+        'mood': 'Calm',
+        'spotify_url': 'https://open.spotify.com/track/3JOVTQ5h8HGFnDdp4VT3MP',
+    },
+    {
+        'title': 'River',
+        'artist': 'Joni Mitchell',
+        'album': 'Blue',
+        'mood': 'Calm',
+        'spotify_url': 'https://open.spotify.com/track/4Tj38fdBhSLCaYRqZAiXnA',
+    },
+
+    # Energetic songs - recommended for users feeling surprised or need stimulation
+    {
+        'title': 'Uptown Funk',
+        'artist': 'Mark Ronson ft. Bruno Mars',
+        'album': 'Uptown Special',
+        'mood': 'Energetic',
+        'spotify_url': 'https://open.spotify.com/track/32OlwWuMpZ6b0aN2RZOeMS',
+    },
+    {
+        'title': 'Don\'t Stop Me Now',
+        'artist': 'Queen',
+        'album': 'Jazz',
+        'mood': 'Energetic',
+        'spotify_url': 'https://open.spotify.com/track/7hQJA50XrCWABAu5v6QZ4i',
+    },
+
+    # Party songs - recommended for users with neutral emotions
+    {
+        'title': 'I Gotta Feeling',
+        'artist': 'Black Eyed Peas',
+        'album': 'The E.N.D.',
+        'mood': 'Party',
+        'spotify_url': 'https://open.spotify.com/track/29l9eumG0WOVkzWBjCEcPt',
+    },
+    {
+        'title': 'Party in the USA',
+        'artist': 'Miley Cyrus',
+        'album': 'The Time of Our Lives',
+        'mood': 'Party',
+        'spotify_url': 'https://open.spotify.com/track/5Q0Nhxo0l2bP3pNjpGJwV1',
+    },
+)
+
+
+class Command(BaseCommand):
+    """
+    Django management command to add mood-improvement songs.
+    
+    Songs are categorized by their therapeutic effect on different emotions.
+    Requires the Happy, Calm, Energetic and Party moods to exist already.
+    
+    Usage:
+        python manage.py add_mood_songs
+    
+    Attributes:
+        help (str): Description shown in Django management command help
+    """
+    help = 'Add curated mood-improvement songs to the database'
+
+    def add_arguments(self, parser):
+        """
+        Register command line options.
+        
+        Args:
+            parser (ArgumentParser): Parser for this command's arguments
+        """
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=settings.BULK_BATCH_SIZE,
+            help='Number of songs inserted per INSERT statement '
+                 '(default: %(default)s, from settings.BULK_BATCH_SIZE)',
+        )
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        """
+        Main execution method for the management command.
+        
+        Inserts the songs that are not in the database yet with a single
+        bulk_create and prints the resulting song distribution by mood.
+        The whole ingest is committed in one transaction.
+        
+        Args:
+            *args: Positional arguments (unused)
+            **options: Keyword arguments from command line options
+            
+        Returns:
+            None
+        """
+        self.stdout.write("Starting mood-improvement songs database population...")
+        self.stdout.write("=" * 50)
+
+        # Retrieve the required mood IDs from database in a single query
+        required_moods = {song_data['mood'] for song_data in MOOD_IMPROVEMENT_SONGS}
+        mood_ids = dict(
+            Mood.objects.filter(name__in=required_moods).values_list('name', 'id')
+        )
+        missing_moods = required_moods - mood_ids.keys()
+        if missing_moods:
+            raise CommandError(
+                f"Required moods missing: {', '.join(sorted(missing_moods))}. "
+                "Create them first, e.g. with setup_initial_data.py."
+            )
+
+        # Skip songs that already exist with a single lookup, then insert the rest in one statement
+        pre_count = Song.objects.count()
+        existing = existing_song_keys(MOOD_IMPROVEMENT_SONGS)
+
+        new_songs = []
+        for song_data in MOOD_IMPROVEMENT_SONGS:
+            if (song_data['title'], song_data['artist']) in existing:
+                self.stdout.write(f"Song already exists: {song_data['title']} by {song_data['artist']}")
+                continue
+            new_songs.append({
+                'title': song_data['title'],
+                'artist': song_data['artist'],
+                'album': song_data['album'],
+                'mood_id': mood_ids[song_data['mood']],
+                'spotify_url': song_data['spotify_url'],
+            })
+            self.stdout.write(
+                f"Song to insert: {song_data['title']} by {song_data['artist']} -> {song_data['mood']}"
+            )
+
+        dict_bulk_create(
+            Song,
+            new_songs,
+            batch_size=options['batch_size'],
+            ignore_conflicts=True
+        )
+        # ignore_conflicts may skip rows inserted concurrently, so count what landed
+        total_count = Song.objects.count()
+        created_count = total_count - pre_count
+
+        # Display operation statistics
+        self.stdout.write("\nOperation Statistics:")
+        self.stdout.write(self.style.SUCCESS(f"New songs added: {created_count}"))
+        self.stdout.write(f"Total songs in database: {total_count}")
+
+        # Display song distribution by mood (counted with a single GROUP BY query,
+        # streamed in chunks rather than loaded all at once)
+        song_counts = Mood.objects.annotate(song_count=Count('songs')).order_by('name')
+        for mood in song_counts.iterator(chunk_size=100):
+            self.stdout.write(f"  {mood.name}: {mood.song_count} songs")
+
+        self.stdout.write("=" * 50)
+        self.stdout.write(
+            self.style.SUCCESS("Mood-improvement songs addition completed successfully!")
+        )
@@ -5,7 +5,11 @@ This module defines a custom Django management command to populate the database
 with initial mood and song data. Can be run using 'python manage.py populate_db'.
 """
 
+from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.db import transaction
+from music.bulk import existing_song_keys
+from music.cache import invalidate_moods_cache
 from music.models import Mood, Song
 
 
@@ -24,12 +28,14 @@ class Command(BaseCommand):
     """
     help = 'Populate the database with initial mood and song data'
 
+    @transaction.atomic
     def handle(self, *args, **kwargs):
         """
         Main execution method for the management command.
         
         Creates mood categories and sample songs, providing console output
-        for each item created. Uses get_or_create to avoid duplicates.
+        for each item created. Uses bulk_create to insert only missing rows,
+        and commits everything in a single transaction.
         
         Args:
             *args: Positional arguments (unused)
@@ -38,11 +44,20 @@ class Command(BaseCommand):
         Returns:
             None
         """
-        # Create mood categories
+        # Create mood categories, letting the unique name constraint skip existing ones
         moods = ['Happy', 'Sad', 'Energetic', 'Calm']
+        existing_moods = set(
+            Mood.objects.filter(name__in=moods).values_list('name', flat=True)
+        )
+        Mood.objects.bulk_create(
+            [Mood(name=mood_name) for mood_name in moods],
+            ignore_conflicts=True,
+            batch_size=settings.BULK_BATCH_SIZE
+        )
+        # No Mood signals from bulk_create; see invalidate_moods_cache
+        transaction.on_commit(invalidate_moods_cache)
         for mood_name in moods:
-            mood, created = Mood.objects.get_or_create(name=mood_name)
-            if created:
+            if mood_name not in existing_moods:
                 self.stdout.write(
                     self.style.SUCCESS(f'Created mood: {mood_name}')
                 )
@@ -55,16 +70,34 @@ class Command(BaseCommand):
             {'title': 'Calm Song', 'artist': 'Artist4', 'mood': 'Calm'},
         ]
 
-        for song_data in songs:
-            mood = Mood.objects.get(name=song_data['mood'])
-            song, created = Song.objects.get_or_create(
+        # Resolve the ID of every mood referenced by the songs with one query
+        mood_ids = dict(
+            Mood.objects.filter(
+                name__in=[song_data['mood'] for song_data in songs]
+            ).values_list('name', 'id')
+        )
+
+        # Filter out existing (title, artist) pairs first so only new songs are reported;
+        # the unique constraint still guards against concurrent inserts
+        existing_songs = existing_song_keys(songs)
+        new_songs = [
+            Song(
                 title=song_data['title'],
                 artist=song_data['artist'],
-                mood=mood
+                mood_id=mood_ids[song_data['mood']]
             )
-            if created:
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f'Added song: {song.title} by {song.artist}'
-                    )
+            for song_data in songs
+            if (song_data['title'], song_data['artist']) not in existing_songs
+        ]
+        Song.objects.bulk_create(
+            new_songs,
+            ignore_conflicts=True,
+            batch_size=settings.BULK_BATCH_SIZE
+        )
+
+        for song in new_songs:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f'Added song: {song.title} by {song.artist}'
                 )
+            )
@@ -0,0 +1,61 @@
+"""
+Django Migration - Unique Song Identity for Moodify
+
+This migration makes (title, artist) the unique identity of a song, so the
+population scripts can rely on the database's unique index for dedup. Databases
+created before this migration may already hold duplicate (title, artist) rows
+(e.g. from re-running populate_db after a song's mood was edited, or from the
+admin), so those are collapsed first, keeping the row with the lowest id.
+
+Generated by Django 4.2.30 on 2026-10-14 11:32
+
+Changes Applied:
+- Song: Removed duplicate (title, artist) rows, keeping the lowest id
+- Song: Added unique constraint uniq_title_artist on (title, artist)
+
+Dependencies:
+- Requires 0002_alter_mood_options_alter_profile_options_and_more migration
+"""
+
+# Generated by Django 4.2.30 on 2026-10-14 11:32
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def remove_duplicate_songs(apps, schema_editor):
+    """
+    Delete all but the lowest-id Song of every duplicated (title, artist) pair.
+
+    No other model references Song, so the extra rows can be dropped outright.
+    """
+    Song = apps.get_model('music', 'Song')
+    songs = Song.objects.using(schema_editor.connection.alias)
+    duplicates = (
+        songs.values('title', 'artist')
+        .annotate(keep_id=Min('id'), rows=Count('id'))
+        .filter(rows__gt=1)
+        .order_by()
+    )
+    for group in duplicates:
+        songs.filter(
+            title=group['title'], artist=group['artist']
+        ).exclude(id=group['keep_id']).delete()
+
+
+class Migration(migrations.Migration):
+    """
+    Database migration enforcing one Song row per (title, artist).
+    """
+
+    dependencies = [
+        ('music', '0002_alter_mood_options_alter_profile_options_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_songs, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='song',
+            constraint=models.UniqueConstraint(fields=('title', 'artist'), name='uniq_title_artist'),
+        ),
+    ]
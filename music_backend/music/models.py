@@ -50,6 +50,11 @@ class Song(models.Model):
         verbose_name = "Song"
         verbose_name_plural = "Songs"
         ordering = ['title']
+        # A song is identified by its title and artist; the unique index also backs
+        # the duplicate checks and bulk_create(ignore_conflicts=True) when populating
+        constraints = [
+            models.UniqueConstraint(fields=['title', 'artist'], name='uniq_title_artist'),
+        ]
 
     def __str__(self) -> str:
         return f"{self.title} by {self.artist}"
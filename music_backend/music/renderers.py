@@ -0,0 +1,32 @@
+"""
+Django REST Framework Renderers for Moodify API
+
+Provides an orjson-based JSON renderer that encodes response payloads
+considerably faster than the stdlib json module used by JSONRenderer.
+"""
+
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# Fallback for types orjson doesn't handle natively (lazy translation strings,
+# Decimal, QuerySet, ...), using the same conversions as DRF's JSONRenderer
+_fallback_encoder = JSONEncoder()
+
+
+class OrjsonRenderer(BaseRenderer):
+    """
+    JSON renderer backed by orjson.
+
+    Registered ahead of JSONRenderer so it serves application/json responses;
+    numpy scalars and arrays are serialized without conversion.
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=_fallback_encoder.default, option=self.options)
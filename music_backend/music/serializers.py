@@ -22,8 +22,9 @@ class SongSerializer(serializers.ModelSerializer):
     Serializer for Song model
     Includes related mood information and all song fields
     """
-    # Display mood name instead of ID for better readability
-    mood = serializers.StringRelatedField()
+    # Display mood name instead of ID for better readability; read straight from
+    # the joined mood row (querysets should select_related('mood'))
+    mood = serializers.CharField(source='mood.name', read_only=True, allow_null=True)
 
     class Meta:
         model = Song
@@ -2,13 +2,18 @@
 Django Signal Handlers for Moodify Music Application
 
 This module contains signal handlers that automatically respond to Django model events.
-Manages user profile creation and updates when User model instances are saved.
+Manages user profile creation when User model instances are saved, and
+evicts deleted authentication tokens and changed moods from their caches.
 """
 
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.contrib.auth.models import User
 from django.dispatch import receiver
-from .models import Profile
+from rest_framework.authtoken.models import Token
+from .auth import invalidate_cached_token
+from .cache import invalidate_moods_cache
+from .models import Mood, Profile
 
 
 @receiver(post_save, sender=User)
@@ -30,17 +35,36 @@ def create_user_profile(sender, instance, created, **kwargs):
         Profile.objects.create(user=instance)
 
 
-@receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
+@receiver(post_delete, sender=Token)
+def evict_cached_token(sender, instance, **kwargs):
     """
-    Signal handler to save the Profile when a User is updated.
+    Signal handler to evict a deleted Token from the authentication cache.
     
-    This function ensures that the associated Profile is saved
-    whenever the User instance is updated, maintaining data consistency.
+    Ensures a token stops authenticating as soon as it is deleted (e.g. on
+    logout) instead of when its cache entry expires. The eviction waits for
+    the delete to commit, so a concurrent request can't re-cache the token
+    in between.
     
     Args:
-        sender (Model): The model class that sent the signal (User)
-        instance (User): The actual User instance being saved
+        sender (Model): The model class that sent the signal (Token)
+        instance (Token): The Token instance being deleted
+        **kwargs: Additional keyword arguments from the signal
+    """
+    key = instance.key
+    transaction.on_commit(lambda: invalidate_cached_token(key), using=kwargs.get('using'))
+
+
+@receiver(post_save, sender=Mood)
+@receiver(post_delete, sender=Mood)
+def evict_cached_moods(sender, **kwargs):
+    """
+    Signal handler to evict the cached mood list when a Mood changes.
+    
+    The eviction waits for the write to commit; evicting earlier would let a
+    concurrent request re-cache the old rows until the entry expires.
+    
+    Args:
+        sender (Model): The model class that sent the signal (Mood)
         **kwargs: Additional keyword arguments from the signal
     """
-    instance.profile.save()
+    transaction.on_commit(invalidate_moods_cache, using=kwargs.get('using'))
@@ -3,10 +3,26 @@ Django Test Suite for Moodify Music API
 Comprehensive tests for mood detection and music recommendation endpoints
 """
 
+import io
+from contextlib import redirect_stdout
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError
+from django.db.models import Count
+from django.test import TestCase
 from django.urls import reverse
 from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.test import APITestCase
-from .models import Mood, Song
+from .auth import CachedTokenAuthentication
+from .cache import MOODS_CACHE_KEY
+from .models import Mood, Profile, Song
+from .services import bulk_register
+from . import views
+from .views import polarity_to_mood
 
 
 class MoodifyAPITests(APITestCase):
@@ -20,6 +36,7 @@ class MoodifyAPITests(APITestCase):
         Set up test data before each test method
         Creates sample moods and songs for testing
         """
+        cache.clear()  # Evictions wait for a commit, which test transactions never make
         self.happy_mood = Mood.objects.create(name="Happy")
         self.sad_mood = Mood.objects.create(name="Sad")
         Song.objects.create(title="Happy Song", artist="Artist1", mood=self.happy_mood)
@@ -36,6 +53,45 @@ class MoodifyAPITests(APITestCase):
         self.assertEqual(len(response.data), 2)
         self.assertEqual(response.data[0]["name"], "Happy")
 
+    def test_get_moods_reflects_new_moods(self):
+        """
+        Test mood list cache invalidation
+        Verifies a cached mood list is refreshed once a mood is added
+        """
+        url = reverse("get_moods")
+        self.assertEqual(len(self.client.get(url).data), 2)
+        with self.captureOnCommitCallbacks(execute=True):
+            Mood.objects.create(name="Calm")
+        response = self.client.get(url)
+        self.assertEqual([mood["name"] for mood in response.data], ["Calm", "Happy", "Sad"])
+
+    def test_mood_cache_evicted_only_on_commit(self):
+        """
+        Test mood list cache eviction timing
+        Verifies the cached list is evicted after the mood write commits, not before
+        """
+        self.client.get(reverse("get_moods"))
+        with self.captureOnCommitCallbacks() as callbacks:
+            Mood.objects.create(name="Calm")
+            self.assertIsNotNone(cache.get(MOODS_CACHE_KEY))
+        self.assertEqual(len(callbacks), 1)
+        callbacks[0]()
+        self.assertIsNone(cache.get(MOODS_CACHE_KEY))
+
+    def test_get_moods_does_not_cache_empty_list(self):
+        """
+        Test mood list caching before seeding
+        Verifies an empty mood list isn't cached, so moods written without
+        signals (e.g. by bulk_create in a seeding script) appear immediately
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            Mood.objects.all().delete()
+        url = reverse("get_moods")
+        self.assertEqual(self.client.get(url).data, [])
+        Mood.objects.bulk_create([Mood(name="Calm")])
+        response = self.client.get(url)
+        self.assertEqual([mood["name"] for mood in response.data], ["Calm"])
+
     def test_get_songs_by_mood_valid(self):
         """
         Test song retrieval by valid mood
@@ -47,6 +103,31 @@ class MoodifyAPITests(APITestCase):
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["title"], "Happy Song")
 
+    def test_get_songs_by_mood_query_count(self):
+        """
+        Test song retrieval query efficiency
+        Verifies songs and their mood names are fetched in a single query
+        """
+        for index in range(5):
+            Song.objects.create(title=f"Happy Song {index}", artist="Artist3", mood=self.happy_mood)
+        url = reverse("get_songs_by_mood")
+        with self.assertNumQueries(1):
+            response = self.client.get(url, {"mood": "happy"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 6)
+        self.assertTrue(all(song["mood"] == "Happy" for song in response.data))
+
+    def test_get_songs_by_mood_without_songs(self):
+        """
+        Test song retrieval for a mood with no songs
+        Verifies an existing but empty mood returns an empty list, not 404
+        """
+        Mood.objects.create(name="Calm")
+        url = reverse("get_songs_by_mood")
+        response = self.client.get(url, {"mood": "calm"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [])
+
     def test_get_songs_by_mood_invalid(self):
         """
         Test song retrieval by invalid mood
@@ -65,3 +146,208 @@ class MoodifyAPITests(APITestCase):
         response = self.client.post(url, {"text": "I am feeling awesome today!"})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn("mood", response.data)
+
+    def test_text_polarity_memoizes_only_short_texts(self):
+        """
+        Test sentiment polarity memoization
+        Verifies short texts are memoized and long texts bypass the memo
+        """
+        views._short_text_polarity.cache_clear()
+        short_text = "I am feeling awesome today!"
+        long_text = short_text * (views.MAX_MEMOIZED_TEXT_LENGTH // len(short_text) + 1)
+
+        first = views._text_polarity(short_text)
+        self.assertEqual(views._text_polarity(short_text), first)
+        self.assertEqual(views._short_text_polarity.cache_info().hits, 1)
+        self.assertEqual(views._short_text_polarity.cache_info().currsize, 1)
+
+        self.assertGreater(views._text_polarity(long_text), 0)
+        self.assertEqual(views._short_text_polarity.cache_info().currsize, 1)
+
+    def test_polarity_to_mood_thresholds(self):
+        """
+        Test polarity to mood bucketing
+        Verifies each threshold is inclusive and low polarities map to Party
+        """
+        cases = [
+            (1.0, "Happy"), (0.3, "Happy"), (0.29, "Energetic"), (0.1, "Energetic"),
+            (0.05, "Calm"), (0.0, "Calm"), (-0.05, "Sad"), (-0.1, "Sad"),
+            (-0.11, "Party"), (-1.0, "Party"),
+        ]
+        for polarity, expected in cases:
+            self.assertEqual(polarity_to_mood(polarity), expected)
+
+    def test_token_rejected_after_logout(self):
+        """
+        Test token authentication across logout
+        Verifies a token stops authenticating once it is deleted
+        """
+        user = User.objects.create_user(username="listener", password="secret123")
+        token = Token.objects.create(user=user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+        response = self.client.get(reverse("check_auth"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["user"]["username"], "listener")
+
+        response = self.client.post(reverse("logout_user"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(reverse("check_auth"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_cached_token_evicted_on_delete(self):
+        """
+        Test cached token authentication
+        Verifies repeat lookups hit the cache and a deleted token is evicted on commit
+        """
+        user = User.objects.create_user(username="listener", password="secret123")
+        token = Token.objects.create(user=user)
+        authentication = CachedTokenAuthentication()
+
+        self.assertEqual(authentication.authenticate_credentials(token.key), (user, token))
+        with self.assertNumQueries(0):
+            cached_user, _ = authentication.authenticate_credentials(token.key)
+        self.assertEqual(cached_user, user)
+
+        key = token.key  # delete() clears the primary key, which is the token key
+        with self.captureOnCommitCallbacks() as callbacks:
+            token.delete()
+        self.assertEqual(authentication.authenticate_credentials(key)[0], user)
+
+        callbacks[0]()
+        with self.assertRaises(AuthenticationFailed):
+            authentication.authenticate_credentials(key)
+
+    def test_register_rejects_taken_username_and_email(self):
+        """
+        Test registration conflict handling
+        Verifies duplicate usernames and emails are reported separately
+        """
+        User.objects.create_user(username="taken", email="taken@example.com", password="secret123")
+        url = reverse("register_user")
+
+        response = self.client.post(url, {
+            "username": "taken", "email": "new@example.com", "password": "secret123"
+        })
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["message"], "Username already exists")
+
+        response = self.client.post(url, {
+            "username": "newcomer", "email": "taken@example.com", "password": "secret123"
+        })
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["message"], "Email already registered")
+
+        response = self.client.post(url, {
+            "username": "newcomer", "email": "new@example.com", "password": "secret123"
+        })
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(Token.objects.filter(key=response.data["token"]).exists())
+        self.assertTrue(Profile.objects.filter(user__username="newcomer").exists())
+
+    def test_bulk_register_creates_users_profiles_and_tokens(self):
+        """
+        Test batch account creation
+        Verifies every user gets a usable password, a profile and their own token
+        """
+        users = [
+            {"username": f"batch{index}", "email": f"batch{index}@example.com",
+             "password": f"secret{index}23"}
+            for index in range(3)
+        ]
+        created = bulk_register(users)
+
+        self.assertEqual([user.username for user, _ in created], ["batch0", "batch1", "batch2"])
+        for index, (user, token) in enumerate(created):
+            stored_user = User.objects.get(username=f"batch{index}")
+            self.assertEqual(stored_user.pk, user.pk)
+            self.assertTrue(stored_user.check_password(f"secret{index}23"))
+            self.assertTrue(Profile.objects.filter(user=stored_user).exists())
+            self.assertEqual(Token.objects.get(key=token.key).user_id, stored_user.pk)
+
+    def test_bulk_register_rolls_back_batch_on_duplicate(self):
+        """
+        Test batch account creation with a duplicate username
+        Verifies the whole batch is rolled back when one username is taken
+        """
+        users = [
+            {"username": "first", "email": "first@example.com", "password": "secret123"},
+            {"username": "first", "email": "second@example.com", "password": "secret123"},
+        ]
+        with self.assertRaises(IntegrityError):
+            bulk_register(users)
+        self.assertFalse(User.objects.filter(username="first").exists())
+        self.assertFalse(Profile.objects.exists())
+        self.assertFalse(Token.objects.exists())
+
+
+class SeedDataTests(TestCase):
+    """
+    Test suite for the data population scripts
+    Tests that re-running them refreshes rows in place without duplicating them
+    """
+
+    def test_setup_initial_data_rerun_refreshes_in_place(self):
+        """
+        Test setup_initial_data idempotency
+        Verifies a second run adds no rows, keeps row ids and restores edited fields
+        """
+        import setup_initial_data
+
+        def seed():
+            with redirect_stdout(io.StringIO()):
+                _, mood_ids = setup_initial_data.create_initial_moods()
+                setup_initial_data.create_sample_songs(mood_ids)
+
+        seed()
+        mood_pks = dict(Mood.objects.values_list("name", "id"))
+        song_pks = {(title, artist): pk for pk, title, artist in Song.objects.values_list("id", "title", "artist")}
+        self.assertEqual(len(mood_pks), len(setup_initial_data.MOODS_DATA))
+        self.assertEqual(len(song_pks), len(setup_initial_data.SAMPLE_SONGS))
+
+        Mood.objects.filter(name="Happy").update(description="Edited")
+        Song.objects.filter(title="Perfect", artist="Ed Sheeran").update(album="Edited")
+        seed()
+
+        self.assertEqual(dict(Mood.objects.values_list("name", "id")), mood_pks)
+        self.assertEqual(
+            {(title, artist): pk for pk, title, artist in Song.objects.values_list("id", "title", "artist")},
+            song_pks,
+        )
+        self.assertEqual(
+            Mood.objects.get(name="Happy").description, dict(setup_initial_data.MOODS_DATA)["Happy"]
+        )
+        self.assertEqual(Song.objects.get(title="Perfect", artist="Ed Sheeran").album, "÷ (Divide)")
+
+    def test_add_mood_songs_reports_missing_moods(self):
+        """
+        Test add_mood_songs without its moods
+        Verifies missing moods are named in a CommandError and nothing is inserted
+        """
+        call_command("populate_db", stdout=io.StringIO())  # Doesn't create Party
+        song_count = Song.objects.count()
+        with self.assertRaisesMessage(CommandError, "Required moods missing: Party"):
+            call_command("add_mood_songs", stdout=io.StringIO())
+        self.assertEqual(Song.objects.count(), song_count)
+
+    def test_population_commands_rerun_without_duplicates(self):
+        """
+        Test populate_db and add_mood_songs idempotency
+        Verifies running both commands twice leaves one row per mood and song
+        """
+        Mood.objects.create(name="Party")  # Used by add_mood_songs, not created by populate_db
+
+        def populate():
+            call_command("populate_db", stdout=io.StringIO())
+            call_command("add_mood_songs", stdout=io.StringIO())
+
+        populate()
+        song_count = Song.objects.count()
+        self.assertGreater(song_count, 0)
+        populate()
+
+        self.assertEqual(Mood.objects.count(), 5)
+        self.assertEqual(Song.objects.count(), song_count)
+        duplicates = Song.objects.values("title", "artist").annotate(rows=Count("id")).filter(rows__gt=1)
+        self.assertFalse(duplicates.exists())
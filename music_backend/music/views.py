@@ -6,30 +6,42 @@ Handles user authentication, mood detection, and music recommendations
 from __future__ import annotations
 
 from django.http import HttpRequest
-from django.contrib.auth import authenticate, login, logout
+from django.contrib.auth import authenticate, user_logged_in, user_logged_out
 from django.contrib.auth.models import User
-from django.views.decorators.csrf import csrf_exempt
+from django.core.cache import cache
+from django.db import IntegrityError
+from django.db.models import Q
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.authtoken.models import Token
-from textblob import TextBlob
+from textblob.en.sentiments import PatternAnalyzer
 
 import numpy as np
 import cv2
-import traceback
+import threading
 import logging
+from bisect import bisect_right
+from functools import lru_cache
 
-from .models import Song, Mood, Profile, UserMood
-from .serializers import MoodSerializer, SongSerializer
+from .cache import MOODS_CACHE_KEY, MOODS_CACHE_TIMEOUT
+from .models import Song, Mood, UserMood
+from .services import bulk_register
 
 # Configure logging for debugging
 logger = logging.getLogger(__name__)
 
 # User Authentication Views
 
-@csrf_exempt
+MIN_PASSWORD_LENGTH = 6
+
+
+def _stripped_fields(data, *names: str) -> list[str]:
+    """Return the named request fields with surrounding whitespace removed ('' if missing)"""
+    return [data.get(name, '').strip() for name in names]
+
+
 @api_view(['POST'])
 @permission_classes([AllowAny])
 def register_user(request):
@@ -38,10 +50,7 @@ def register_user(request):
     Creates new user account with validation and generates authentication token
     """
     try:
-        data = request.data
-        username = data.get('username', '').strip()
-        email = data.get('email', '').strip()
-        password = data.get('password', '').strip()
+        username, email, password = _stripped_fields(request.data, 'username', 'email', 'password')
         
         # Input validation
         if not username or not email or not password:
@@ -50,36 +59,41 @@ def register_user(request):
                 'message': 'Username, email and password are required'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        if len(password) < 6:
+        if len(password) < MIN_PASSWORD_LENGTH:
             return Response({
                 'success': False,
-                'message': 'Password must be at least 6 characters long'
+                'message': f'Password must be at least {MIN_PASSWORD_LENGTH} characters long'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        # Check for existing users
-        if User.objects.filter(username=username).exists():
+        # Check for existing users (username and email in a single query)
+        conflicts = list(
+            User.objects.filter(Q(username=username) | Q(email=email))
+            .values_list('username', flat=True)
+        )
+        if username in conflicts:
             return Response({
                 'success': False,
                 'message': 'Username already exists'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        if User.objects.filter(email=email).exists():
+        if conflicts:
             return Response({
                 'success': False,
                 'message': 'Email already registered'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        # Create new user and profile
-        user = User.objects.create_user(
-            username=username,
-            email=email,
-            password=password
-        )
-        
-        Profile.objects.get_or_create(user=user)
-        
-        # Generate authentication token
-        token, created = Token.objects.get_or_create(user=user)
+        # Create new user with its profile and authentication token in one transaction;
+        # none of them can exist yet, so skip get_or_create
+        try:
+            user, token = bulk_register([
+                {'username': username, 'email': email, 'password': password}
+            ])[0]
+        except IntegrityError:
+            # Lost a race with a concurrent registration for the same username
+            return Response({
+                'success': False,
+                'message': 'Username already exists'
+            }, status=status.HTTP_400_BAD_REQUEST)
         
         return Response({
             'success': True,
@@ -100,7 +114,6 @@ def register_user(request):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-@csrf_exempt
 @api_view(['POST'])
 @permission_classes([AllowAny])
 def login_user(request):
@@ -109,9 +122,7 @@ def login_user(request):
     Authenticates user credentials and returns authentication token
     """
     try:
-        data = request.data
-        username = data.get('username', '').strip()
-        password = data.get('password', '').strip()
+        username, password = _stripped_fields(request.data, 'username', 'password')
         
         if not username or not password:
             return Response({
@@ -124,7 +135,9 @@ def login_user(request):
         
         if user is not None:
             if user.is_active:
-                login(request, user)
+                # API clients authenticate with tokens, so no session is started; the
+                # signal still records last_login like django.contrib.auth.login()
+                user_logged_in.send(sender=user.__class__, request=request, user=user)
                 
                 # Get or create authentication token
                 token, created = Token.objects.get_or_create(user=user)
@@ -158,7 +171,6 @@ def login_user(request):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-@csrf_exempt
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def logout_user(request):
@@ -171,7 +183,7 @@ def logout_user(request):
         if hasattr(request.user, 'auth_token'):
             request.user.auth_token.delete()
         
-        logout(request)
+        user_logged_out.send(sender=request.user.__class__, request=request, user=request.user)
         
         return Response({
             'success': True,
@@ -186,7 +198,6 @@ def logout_user(request):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-@csrf_exempt
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def check_auth(request):
@@ -218,6 +229,28 @@ def check_auth(request):
 # 🎵 Music API Views (Existing functionality preserved)
 # ---------------------------------------------------------------------------
 
+# One shared sentiment analyzer (what TextBlob(...).sentiment uses underneath),
+# warmed at import so the lexicon is loaded before the first request
+_SENTIMENT_ANALYZER = PatternAnalyzer()
+_SENTIMENT_ANALYZER.analyze("warmup")
+
+
+# Longest text whose polarity is memoized; bounds the memo to about
+# 1024 x 256 characters no matter how large request bodies get
+MAX_MEMOIZED_TEXT_LENGTH = 256
+
+
+@lru_cache(maxsize=1024)
+def _short_text_polarity(text: str) -> float:
+    return _SENTIMENT_ANALYZER.analyze(text).polarity
+
+
+def _text_polarity(text: str) -> float:
+    """Sentiment polarity of text, memoized only for short repetitive prompts"""
+    if len(text) <= MAX_MEMOIZED_TEXT_LENGTH:
+        return _short_text_polarity(text)
+    return _SENTIMENT_ANALYZER.analyze(text).polarity
+
 MOOD_MAP: list[tuple[float, str]] = [
     (0.3, "Happy"),
     (0.1, "Energetic"),
@@ -225,20 +258,43 @@ MOOD_MAP: list[tuple[float, str]] = [
     (-0.1, "Sad"),
 ]
 
+# MOOD_MAP flattened into ascending thresholds for bisect; polarities below
+# every threshold fall back to "Party"
+_MOOD_THRESHOLDS: list[float] = [threshold for threshold, _ in reversed(MOOD_MAP)]
+_MOOD_LABELS: list[str] = ["Party"] + [label for _, label in reversed(MOOD_MAP)]
+
+
 def polarity_to_mood(polarity: float) -> str:
-    for threshold, label in MOOD_MAP:
-        if polarity >= threshold:
-            return label
-    return "Party"
+    return _MOOD_LABELS[bisect_right(_MOOD_THRESHOLDS, polarity)]
+
+
+# Read-only list endpoints return .values() rows directly instead of going through
+# ModelSerializer; the field lists mirror MoodSerializer/SongSerializer output
+MOOD_LIST_FIELDS: tuple[str, ...] = ("id", "name", "description")
+SONG_LIST_FIELDS: tuple[str, ...] = (
+    "id", "title", "artist", "album", "mood__name",
+    "spotify_url", "preview_url", "cover_image_url",
+)
+
+
+def fast_serialize_song(row: dict) -> dict:
+    """Shape a Song .values() row like SongSerializer (mood as its name)"""
+    row["mood"] = row.pop("mood__name")
+    return row
 
 
 @api_view(["GET"])
 @permission_classes([AllowAny])  # Keep existing endpoints accessible without auth
 def get_moods(_: HttpRequest) -> Response:
-    """Return all available mood labels"""
-    moods = Mood.objects.all()
-    serializer = MoodSerializer(moods, many=True)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    """Return all available mood labels (cached for up to MOODS_CACHE_TIMEOUT)"""
+    moods = cache.get(MOODS_CACHE_KEY)
+    if moods is None:
+        moods = list(Mood.objects.values(*MOOD_LIST_FIELDS))
+        # Don't cache an empty list, so moods seeded by another process show up
+        # on the next request instead of after the timeout
+        if moods:
+            cache.set(MOODS_CACHE_KEY, moods, MOODS_CACHE_TIMEOUT)
+    return Response(moods, status=status.HTTP_200_OK)
 
 
 @api_view(["GET"])
@@ -250,14 +306,15 @@ def get_songs_by_mood(request: HttpRequest) -> Response:
         return Response({"error": "Missing 'mood' query parameter."},
                         status=status.HTTP_400_BAD_REQUEST)
 
-    mood = Mood.objects.filter(name__iexact=mood_name).first()
-    if not mood:
+    # Plain rows with the mood name joined in, in the same shape SongSerializer produces;
+    # the mood is matched through the join, so the hot path is a single query
+    rows = Song.objects.filter(mood__name__iexact=mood_name).values(*SONG_LIST_FIELDS)
+    songs = [fast_serialize_song(row) for row in rows]
+    if not songs and not Mood.objects.filter(name__iexact=mood_name).exists():
         return Response({"error": "Mood not found."},
                         status=status.HTTP_404_NOT_FOUND)
 
-    songs = Song.objects.filter(mood=mood)
-    serializer = SongSerializer(songs, many=True)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    return Response(songs, status=status.HTTP_200_OK)
 
 
 @api_view(["POST"])
@@ -270,7 +327,7 @@ def detect_mood_from_text(request: HttpRequest) -> Response:
                         status=status.HTTP_400_BAD_REQUEST)
 
     try:
-        polarity = TextBlob(user_text).sentiment.polarity
+        polarity = _text_polarity(user_text)
         detected_mood = polarity_to_mood(polarity)
         return Response({"mood": detected_mood, "polarity": polarity},
                         status=status.HTTP_200_OK)
@@ -279,6 +336,75 @@ def detect_mood_from_text(request: HttpRequest) -> Response:
                         status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+# FER loads its TensorFlow/Keras weights and MTCNN graphs on construction, so a
+# single detector is built on first use and shared across requests
+_FER_DETECTOR = None
+_FER_LOCK = threading.Lock()
+
+
+def _get_detector():
+    """Return the shared FER detector, creating it on first call"""
+    global _FER_DETECTOR
+    if _FER_DETECTOR is None:
+        with _FER_LOCK:
+            if _FER_DETECTOR is None:
+                from fer import FER  # ✅ Delayed import to avoid startup errors
+                _FER_DETECTOR = FER(mtcnn=True)
+    return _FER_DETECTOR
+
+
+# Large uploads are decoded at half resolution, and every image is capped at
+# MAX_IMAGE_DIMENSION pixels on its longest side before face detection
+REDUCED_DECODE_MIN_BYTES = 1024 * 1024
+MAX_IMAGE_DIMENSION = 640
+
+
+# Each worker thread keeps one upload buffer (at least 1 MB) and reuses it across
+# requests; uploads larger than the cap get a one-off buffer instead of growing it
+_UPLOAD_BUFFERS = threading.local()
+MAX_POOLED_UPLOAD_BYTES = 8 * 1024 * 1024
+
+
+def _read_upload(upload) -> np.ndarray:
+    """
+    Copy an uploaded file's chunks into this thread's reusable uint8 buffer.
+
+    The returned array is a view on that buffer, valid until the thread reads
+    its next upload (cv2.imdecode copies the pixels out immediately).
+    """
+    size = upload.size
+    if size > MAX_POOLED_UPLOAD_BYTES:
+        buf = bytearray(size)
+    else:
+        buf = getattr(_UPLOAD_BUFFERS, 'buf', None)
+        if buf is None or len(buf) < size:
+            buf = _UPLOAD_BUFFERS.buf = bytearray(max(size, 1 << 20))
+    view = memoryview(buf)
+    offset = 0
+    for chunk in upload.chunks():
+        view[offset:offset + len(chunk)] = chunk
+        offset += len(chunk)
+    return np.frombuffer(buf, np.uint8, count=offset)
+
+
+def _decode_image(img_array: np.ndarray) -> np.ndarray | None:
+    """Decode an encoded image buffer into a BGR array sized for FER"""
+    if len(img_array) > REDUCED_DECODE_MIN_BYTES:
+        img = cv2.imdecode(img_array, cv2.IMREAD_REDUCED_COLOR_2)
+    else:
+        img = cv2.imdecode(img_array, cv2.IMREAD_COLOR)
+    if img is None:
+        return None
+
+    height, width = img.shape[:2]
+    longest_side = max(height, width)
+    if longest_side > MAX_IMAGE_DIMENSION:
+        scale = MAX_IMAGE_DIMENSION / longest_side
+        img = cv2.resize(img, (max(1, round(width * scale)), max(1, round(height * scale))),
+                         interpolation=cv2.INTER_AREA)
+    return img
+
+
 @api_view(["POST"])
 @permission_classes([AllowAny])  # Keep existing endpoints accessible without auth
 def detect_mood_from_image(request: HttpRequest) -> Response:
@@ -288,18 +414,20 @@ def detect_mood_from_image(request: HttpRequest) -> Response:
                         status=status.HTTP_400_BAD_REQUEST)
 
     try:
-        from fer import FER  # ✅ Delayed import to avoid startup errors
-
         image_file = request.FILES['image']
-        img_array = np.frombuffer(image_file.read(), np.uint8)
-        img = cv2.imdecode(img_array, cv2.IMREAD_COLOR)
+        img_array = _read_upload(image_file)
+        img = _decode_image(img_array)
 
         if img is None:
             return Response({'error': 'Invalid image file.'},
                             status=status.HTTP_400_BAD_REQUEST)
 
-        detector = FER(mtcnn=True)
-        results = detector.detect_emotions(img)
+        # cv2 decodes to contiguous BGR, which is what FER expects: it converts to
+        # grayscale itself with COLOR_BGR2GRAY, so no channel conversion is done here.
+        # Inference on the shared detector is serialized since FER isn't thread-safe
+        detector = _get_detector()
+        with _FER_LOCK:
+            results = detector.detect_emotions(img)
 
         if not results:
             return Response({'error': 'No face or emotion detected.'},
@@ -310,5 +438,5 @@ def detect_mood_from_image(request: HttpRequest) -> Response:
 
         return Response({"emotion": dominant_emotion}, status=status.HTTP_200_OK)
     except Exception as e:
-        traceback.print_exc()  # ✅ Print complete exception info to terminal
+        logger.exception("detect_mood_from_image failed")  # ✅ Log complete exception info
         return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -15,6 +15,11 @@ except ImportError:
     dj_database_url = None
     dotenv = None
 
+try:
+    import orjson                # For faster JSON response rendering
+except ImportError:
+    orjson = None
+
 # Build paths inside the project
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -107,6 +112,26 @@ else:
     else:
         print("dj_database_url not available, falling back to SQLite")
 
+# Rows per INSERT statement for bulk_create in the population commands.
+# 500 stays under SQLite's bound-parameter limit; PostgreSQL/MySQL can go
+# as high as ~10000. Sensible tuning range is 100-10000.
+BULK_BATCH_SIZE = int(os.getenv("MOODIFY_BULK_BATCH_SIZE", "500"))
+
+# Cache Configuration
+# REDIS_URL enables a cache shared by all gunicorn workers and management
+# scripts. Without it Django uses a per-process LocMemCache, which can't be
+# invalidated across processes, so cross-request caching is scaled back
+REDIS_URL = os.getenv("REDIS_URL", None)
+SHARED_CACHE = bool(REDIS_URL)
+
+if SHARED_CACHE:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+
 # Password Validation
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
@@ -125,6 +150,10 @@ USE_TZ = True
 STATIC_URL = "/static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
+# Upload Handling
+# Keep typical photo uploads in memory instead of spooling them to a temp file
+FILE_UPLOAD_MAX_MEMORY_SIZE = 5 * 1024 * 1024  # 5 MB
+
 # Default Primary Key Field Type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -153,13 +182,23 @@ CORS_ALLOW_HEADERS = [
 
 # Django REST Framework Configuration
 REST_FRAMEWORK = {
+    # API clients send 'Authorization: Token <key>'; sessions are only used by the admin
+    # Token lookups are only cached when every worker sees the same cache, so a
+    # deleted token is evicted everywhere at once
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.SessionAuthentication',
-        'rest_framework.authentication.TokenAuthentication',
+        'music.auth.CachedTokenAuthentication' if SHARED_CACHE
+        else 'rest_framework.authentication.TokenAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',  # Allow unauthenticated access by default
     ],
+    # orjson renders application/json when installed; stdlib JSONRenderer otherwise
+    'DEFAULT_RENDERER_CLASSES': (
+        ['music.renderers.OrjsonRenderer'] if orjson else []
+    ) + [
+        'rest_framework.renderers.JSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
 }
 
 # Authentication Configuration